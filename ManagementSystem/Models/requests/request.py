@@ -5,8 +5,7 @@ from fastapi import APIRouter, HTTPException
 # Change to relative imports
 from ..schemas.database import (
     database, Student, Faculty, Admin,
-    StudentBase, FacultyBase, AdminBase,
-    init_db
+    StudentBase, FacultyBase, AdminBase
 )
 import json
 
@@ -27,15 +26,6 @@ class CreateAccountRequest(BaseModel):
     faculty_id: Optional[str]
     admin_id: Optional[str]
 
-@router.on_event("startup")
-async def startup():
-    await database.connect()
-    init_db()  # Initialize database tables
-
-@router.on_event("shutdown")
-async def shutdown():
-    await database.disconnect()
-
 @router.post("/")
 async def create_account(request: CreateAccountRequest):
     try:
@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from typing import List, Optional
+from functools import lru_cache
 from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, create_engine, MetaData
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
@@ -131,11 +132,21 @@ class FeedbackTransaction(Base):
     student = relationship("Student", back_populates="feedback_transactions")
     faculty = relationship("Faculty", back_populates="feedback_received")
 
-# Create database engine
-engine = create_engine(DATABASE_URL)
+# Create database engine lazily so importing the models does not load the DB driver
+@lru_cache(maxsize=None)
+def get_engine():
+    return create_engine(DATABASE_URL)
+
+def __getattr__(name):
+    # Backward compatibility for the old module-level `engine`
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Create all tables
-def init_db():
+def init_db(engine=None):
+    if engine is None:
+        engine = get_engine()
     Base.metadata.drop_all(bind=engine)  # Clear existing tables
     Base.metadata.create_all(bind=engine)
     print("Database tables created successfully!")
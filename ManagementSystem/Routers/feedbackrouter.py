@@ -1,16 +1,21 @@
-from fastapi import APIRouter, HTTPException, Header
+from fastapi import APIRouter, HTTPException, Header, Request, Depends
 from typing import List, Optional
 import json
 
 # Change to relative imports
 from ..Models.schemas.database import database, FeedbackTransaction, Faculty, Student
-from ..utils.encryption import encryption_service
+from ..utils.encryption import EncryptionService, get_encryption_service
 from datetime import datetime
 
 router = APIRouter()
 
+def get_encryption(request: Request) -> EncryptionService:
+    """Use the service set up by the app lifespan, or build it on first use"""
+    service = getattr(request.app.state, "encryption_service", None)
+    return service if service is not None else get_encryption_service()
+
 @router.post("/submit-feedback")
-async def submit_feedback(feedback: dict):
+async def submit_feedback(feedback: dict, encryption_service: EncryptionService = Depends(get_encryption)):
     try:
         # Extract student ID and instructor info from feedback
         student_id = feedback.get('student_id')
@@ -75,7 +80,10 @@ async def submit_feedback(feedback: dict):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/get-feedback")
-async def get_feedback(faculty_id: Optional[str] = Header(None, alias="X-Faculty-ID")):
+async def get_feedback(
+    faculty_id: Optional[str] = Header(None, alias="X-Faculty-ID"),
+    encryption_service: EncryptionService = Depends(get_encryption)
+):
     try:
         if not faculty_id:
             raise HTTPException(status_code=400, detail="Faculty ID is required in X-Faculty-ID header")
@@ -146,7 +154,7 @@ async def get_feedback(faculty_id: Optional[str] = Header(None, alias="X-Faculty
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/get-feedback/{student_id}")  
-async def get_student_feedback(student_id: str):
+async def get_student_feedback(student_id: str, encryption_service: EncryptionService = Depends(get_encryption)):
     """Get feedback for a specific student (for student dashboard)"""
     try:
         # Convert student_id appropriately
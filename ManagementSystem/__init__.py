@@ -6,7 +6,11 @@ A FastAPI-based backend for college management with blockchain integration.
 __version__ = "1.0.0"
 __author__ = "SANIT-M Team"
 
-# Import main components for easy access
-from .main import app
+__all__ = ["app"]
 
-__all__ = ["app"]
\ No newline at end of file
+def __getattr__(name):
+    # Import the app lazily so importing the package stays cheap
+    if name == "app":
+        from .main import app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
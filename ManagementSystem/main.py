@@ -1,14 +1,31 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 # Change to relative imports (notice the dots)
 from .Routers.feedbackrouter import router as FeedbackRouter
 from .Models.requests.request import router as RequestRouter
+from .Models.schemas.database import database, get_engine, init_db
+from .utils.encryption import get_encryption_service
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Heavy subsystems (keys, DB engine) are set up here instead of at import time
+    app.state.encryption_service = get_encryption_service()
+    app.state.engine = get_engine()
+    await database.connect()
+    try:
+        init_db(app.state.engine)  # Initialize database tables
+        yield
+    finally:
+        await database.disconnect()
+        app.state.engine.dispose()
 
 app = FastAPI(
     title="SANIT-M Management System",
     description="A FastAPI-based backend for college management with blockchain integration",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
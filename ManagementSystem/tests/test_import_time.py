@@ -0,0 +1,61 @@
+"""
+Import-time budget checks for the ManagementSystem package.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Cumulative import time allowed for `import ManagementSystem`, in microseconds
+IMPORT_BUDGET_US = 50_000
+
+# Heavy subsystems that must only be loaded on first use or in the app lifespan
+LAZY_MODULES = ["dotenv", "cryptography.hazmat", "sqlalchemy", "databases"]
+
+
+def _run_python(code, env=None):
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+
+def _parse_importtime(stderr):
+    """Map each imported module name to its cumulative import time in microseconds"""
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        if not cumulative_us.strip().isdigit():
+            continue  # Header line
+        cumulative[name.strip()] = int(cumulative_us)
+    return cumulative
+
+
+def test_package_import_within_budget():
+    result = _run_python("import ManagementSystem")
+    assert result.returncode == 0, result.stderr
+
+    imports = _parse_importtime(result.stderr)
+    assert imports["ManagementSystem"] < IMPORT_BUDGET_US
+
+    for module in LAZY_MODULES:
+        loaded = [name for name in imports if name == module or name.startswith(module + ".")]
+        assert not loaded, f"{module} imported eagerly: {loaded}"
+
+
+def test_main_imports_without_keys():
+    pytest.importorskip("fastapi")
+
+    env = {k: v for k, v in os.environ.items() if k not in ("public_key", "private_key")}
+    result = _run_python("import ManagementSystem.main", env=env)
+    assert result.returncode == 0, result.stderr
@@ -2,6 +2,12 @@
 Utility functions and services.
 """
 
-from .encryption import encryption_service
+from .encryption import EncryptionService, get_encryption_service
 
-__all__ = ["encryption_service"]
\ No newline at end of file
+__all__ = ["EncryptionService", "get_encryption_service", "encryption_service"]
+
+def __getattr__(name):
+    # Backward compatibility for `from utils import encryption_service`
+    if name == "encryption_service":
+        return get_encryption_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
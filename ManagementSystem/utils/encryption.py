@@ -4,11 +4,9 @@ from cryptography.hazmat.backends import default_backend
 import base64
 import json
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
-
 class EncryptionService:
     def __init__(self):
         # Load public and private keys from environment
@@ -86,5 +84,15 @@ class EncryptionService:
             print(f"Decryption error: {e}")
             raise
 
-# Create global instance
-encryption_service = EncryptionService()
\ No newline at end of file
+@lru_cache(maxsize=None)
+def get_encryption_service() -> EncryptionService:
+    """Build the shared encryption service on first use"""
+    # Load environment variables only when the keys are actually needed
+    load_dotenv()
+    return EncryptionService()
+
+def __getattr__(name):
+    # Backward compatibility for `from utils.encryption import encryption_service`
+    if name == "encryption_service":
+        return get_encryption_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")